@@ -8,6 +8,11 @@ from typing import Dict, Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _ConfigLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _ConfigLoader
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(message)s")
 log = logging.getLogger("scraper")
@@ -55,7 +60,7 @@ def load_config(config_path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     if config_path.exists():
         try:
             with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
+                user_config = yaml.load(f, Loader=_ConfigLoader)
                 if user_config:
                     # Merge configs, with nested dictionary support
                     def deep_update(d, u):
@@ -7,7 +7,7 @@ import logging
 import ssl
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Set
+from typing import Dict, Any, Iterable, Set
 
 import pymongo
 
@@ -235,13 +235,26 @@ class JSONStorage:
                                              ensure_ascii=False, indent=2), encoding="utf-8")
 
     def load_seen(self) -> Set[str]:
-        """Load set of already seen review IDs"""
-        return set(
-            self.seen_ids_path.read_text(encoding="utf-8").splitlines()) if self.seen_ids_path.exists() else set()
+        """Load set of already seen review IDs, compacting the append-only log"""
+        if not self.seen_ids_path.exists():
+            return set()
+        lines = self.seen_ids_path.read_text(encoding="utf-8").splitlines()
+        ids = {line for line in lines if line}
+        # Rewrite the log when appends have accumulated duplicates/blanks
+        if len(lines) > len(ids):
+            self.save_seen(ids)
+        return ids
 
     def save_seen(self, ids: Set[str]):
         """Save set of already seen review IDs"""
-        self.seen_ids_path.write_text("\n".join(ids), encoding="utf-8")
+        self.seen_ids_path.write_text("\n".join(ids) + "\n" if ids else "", encoding="utf-8")
+
+    def append_seen(self, new_ids: Iterable[str]):
+        """Append newly seen review IDs without rewriting the whole file"""
+        if not new_ids:
+            return
+        with self.seen_ids_path.open("a", encoding="utf-8") as f:
+            f.writelines(f"{rid}\n" for rid in new_ids)
 
 
 def merge_review(existing: Dict[str, Any] | None, raw: RawReview) -> Dict[str, Any]:
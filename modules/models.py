@@ -34,9 +34,51 @@ class RawReview:
     PHOTO_BTN = "button.Tya61d"
     OWNER_RESP = "div.CDe7pd"
 
+    # Extract every field of a card in one ChromeDriver round-trip instead of
+    # one find_elements call per selector. Mirrors first_text/first_attr:
+    # first match with a non-empty value wins.
+    _BULK_JS = """
+        const card = arguments[0];
+        const text = sel => {
+            for (const el of card.querySelectorAll(sel)) {
+                const t = (el.innerText || '').trim();
+                if (t) return t;
+            }
+            return '';
+        };
+        const attr = (sel, a) => {
+            for (const el of card.querySelectorAll(sel)) {
+                const v = (el.getAttribute(a) || '').trim();
+                if (v) return v;
+            }
+            return '';
+        };
+        return {
+            author: text('div[class*="d4r55"]'),
+            profile: attr('button[data-review-id]', 'data-href'),
+            avatar: attr('button[data-review-id] img', 'src'),
+            label: attr('span[role="img"]', 'aria-label'),
+            date: text('span[class*="rsqaWe"]'),
+            text: text('span[jsname="bN97Pc"]') || text('span[jsname="fbQN7e"]')
+                  || text('div.MyEned span.wiI7pd'),
+            likes: (() => {
+                const b = card.querySelector('button[jsaction*="toggleThumbsUp" i]');
+                return b ? ((b.innerText || b.getAttribute('aria-label')) || '') : '';
+            })(),
+            photos: Array.from(card.querySelectorAll('button.Tya61d'))
+                         .map(b => b.getAttribute('style') || ''),
+            owner_date: text('div.CDe7pd span.DZSIDd'),
+            owner_text: text('div.CDe7pd div.wiI7pd'),
+        };
+    """
+
     @classmethod
-    def from_card(cls, card: WebElement) -> "RawReview":
-        """Factory method to create a RawReview from a WebElement"""
+    def from_card(cls, card: WebElement, now=None) -> "RawReview":
+        """
+        Factory method to create a RawReview from a WebElement.
+        `now` is an optional pre-captured UTC datetime shared across a batch
+        of cards so date parsing avoids one clock read per review.
+        """
         # expand "More" - non-blocking approach
         for b in try_find(card, cls.MORE_BTN, all=True):
             try:
@@ -45,40 +87,64 @@ class RawReview:
                 pass
 
         rid = card.get_attribute("data-review-id") or ""
-        author = first_text(card, 'div[class*="d4r55"]')
-        profile = first_attr(card, 'button[data-review-id]', "data-href")
-        avatar = first_attr(card, 'button[data-review-id] img', "src")
 
-        label = first_attr(card, 'span[role="img"]', "aria-label")
+        # Try the single-round-trip bulk extraction first
+        data = None
+        driver = getattr(card, "parent", None)
+        if driver is not None:
+            try:
+                data = driver.execute_script(cls._BULK_JS, card)
+            except Exception:
+                data = None
+
+        if data is not None:
+            author = data.get("author") or ""
+            profile = data.get("profile") or ""
+            avatar = data.get("avatar") or ""
+            label = data.get("label") or ""
+            date = data.get("date") or ""
+            text = data.get("text") or ""
+            likes = safe_int(data.get("likes") or "")
+            photos = [m.group(1) for style in (data.get("photos") or [])
+                      if (m := re.search(r'url\("([^"]+)"', style))]
+            owner_date = data.get("owner_date") or ""
+            owner_text = data.get("owner_text") or ""
+        else:
+            # Fallback: one find_elements round-trip per selector
+            author = first_text(card, 'div[class*="d4r55"]')
+            profile = first_attr(card, 'button[data-review-id]', "data-href")
+            avatar = first_attr(card, 'button[data-review-id] img', "src")
+            label = first_attr(card, 'span[role="img"]', "aria-label")
+            date = first_text(card, 'span[class*="rsqaWe"]')
+
+            text = ""
+            for sel in ('span[jsname="bN97Pc"]',
+                        'span[jsname="fbQN7e"]',
+                        'div.MyEned span.wiI7pd'):
+                text = first_text(card, sel)
+                if text: break
+
+            likes = 0
+            if (btn := try_find(card, cls.LIKE_BTN)):
+                likes = safe_int(btn[0].text or btn[0].get_attribute("aria-label"))
+
+            photos = []
+            for btn in try_find(card, cls.PHOTO_BTN, all=True):
+                if (m := re.search(r'url\("([^"]+)"', btn.get_attribute("style") or "")):
+                    photos.append(m.group(1))
+
+            owner_date = owner_text = ""
+            if (box := try_find(card, cls.OWNER_RESP)):
+                box = box[0]
+                owner_date = first_text(box, "span.DZSIDd")
+                owner_text = first_text(box, "div.wiI7pd")
+
         num = re.search(r"[\d\.]+", label.replace(",", ".")) if label else None
         rating = float(num.group()) if num else 0.0
 
-        date = first_text(card, 'span[class*="rsqaWe"]')
         # Parse the date string to ISO format
-        review_date = parse_date_to_iso(date)
-
-        text = ""
-        for sel in ('span[jsname="bN97Pc"]',
-                    'span[jsname="fbQN7e"]',
-                    'div.MyEned span.wiI7pd'):
-            text = first_text(card, sel)
-            if text: break
+        review_date = parse_date_to_iso(date, now=now)
         lang = detect_lang(text)
 
-        likes = 0
-        if (btn := try_find(card, cls.LIKE_BTN)):
-            likes = safe_int(btn[0].text or btn[0].get_attribute("aria-label"))
-
-        photos: list[str] = []
-        for btn in try_find(card, cls.PHOTO_BTN, all=True):
-            if (m := re.search(r'url\("([^"]+)"', btn.get_attribute("style") or "")):
-                photos.append(m.group(1))
-
-        owner_date = owner_text = ""
-        if (box := try_find(card, cls.OWNER_RESP)):
-            box = box[0]
-            owner_date = first_text(box, "span.DZSIDd")
-            owner_text = first_text(box, "div.wiI7pd")
-
         return cls(rid, author, rating, date, lang, text, likes,
                    photos, profile, avatar, owner_date, owner_text, review_date)
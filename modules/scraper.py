@@ -8,6 +8,8 @@ import platform
 import re
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 import undetected_chromedriver as uc
@@ -21,6 +23,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from tqdm import tqdm
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pragma: no cover - optional speedup
+    ScalableBloomFilter = None
+
 from modules.data_storage import MongoDBStorage, JSONStorage, merge_review
 from modules.models import RawReview
 
@@ -169,6 +176,22 @@ class GoogleReviewsScraper:
         self.backup_to_json = config.get("backup_to_json", True)
         self.overwrite_existing = config.get("overwrite_existing", False)
 
+    @staticmethod
+    def _build_seen_filter(seen):
+        """
+        Build a Bloom pre-filter over already-seen review IDs.
+        Membership tests on the filter are cheaper than hashing the full ID
+        string against a large set; false positives fall through to the set.
+        Falls back to the set itself when pybloom_live is not installed.
+        """
+        if ScalableBloomFilter is None:
+            return seen
+        bloom = ScalableBloomFilter(initial_capacity=max(len(seen), 1000),
+                                    error_rate=0.001)
+        for review_id in seen:
+            bloom.add(review_id)
+        return bloom
+
     def setup_driver(self, headless: bool) -> Chrome:
         """
         Set up and configure Chrome driver with flexibility for different environments.
@@ -373,6 +396,11 @@ class GoogleReviewsScraper:
         successful_method = None
         successful_selector = None
 
+        # The same elements match several of the selectors above; cache the
+        # is_reviews_tab verdict per WebElement ref so the expensive
+        # get_attribute/text round-trips run once per element, not per selector
+        verdict_cache: Dict[str, bool] = {}
+
         # Try each selector in turn
         for selector in tab_selectors:
             if time.time() > end_time:
@@ -388,7 +416,13 @@ class GoogleReviewsScraper:
                     attempts += 1
 
                     # First check if this is actually a reviews tab
-                    if not self.is_reviews_tab(element):
+                    element_ref = getattr(element, "_id", None)
+                    verdict = verdict_cache.get(element_ref)
+                    if verdict is None:
+                        verdict = self.is_reviews_tab(element)
+                        if element_ref is not None:
+                            verdict_cache[element_ref] = verdict
+                    if not verdict:
                         continue
 
                     # Found a reviews tab, attempt to click it with multiple methods
@@ -718,6 +752,36 @@ class GoogleReviewsScraper:
 
             # 3. Find and click the desired sort option in the menu
 
+            # Fast path: one JS round-trip scans the menu items and clicks the
+            # first label match, instead of waiting on
+            # presence_of_all_elements_located and calling .text per item
+            try:
+                clicked = driver.execute_script(
+                    """
+                    const wanted = arguments[0];
+                    const items = document.querySelectorAll(arguments[1]);
+                    for (const el of items) {
+                        const text = (el.innerText || '').trim();
+                        if (!text) continue;
+                        for (const label of wanted) {
+                            if (text.includes(label) || label.includes(text)) {
+                                el.click();
+                                return true;
+                            }
+                        }
+                    }
+                    return false;
+                    """,
+                    list(SORT_OPTIONS.get(method, ())),
+                    'div[role="menuitemradio"], ' + MENU_ITEMS)
+                if clicked:
+                    time.sleep(1.5)  # Wait for sort to take effect
+                    if not self.check_if_menu_opened(driver):
+                        log.info(f"Successfully set sort order to '{method}' via single JS pass")
+                        return True
+            except Exception as e:
+                log.debug(f"JS menu-click fast path failed: {e}")
+
             # Selectors for menu items with focus on the exact HTML structure
             menu_item_selectors = [
                 # Exact Google Maps menu item selectors
@@ -1027,8 +1091,19 @@ class GoogleReviewsScraper:
             log.debug(f"Error checking menu state: {e}")
             return False
 
-    def scrape(self):
-        """Main scraper method"""
+    def scrape(self, driver: Chrome = None):
+        """
+        Main scraper method.
+
+        A running driver can be passed in to reuse one browser across many
+        scrapes (saves the multi-second Chrome startup per call); the caller
+        then owns the driver's lifecycle. Without one, a fresh driver is
+        created and quit as before.
+
+        Returns a stats dict on success (review_count, new_reviews,
+        elapsed_seconds) so callers can verify the run without re-reading
+        the JSON file just written; returns False on failure.
+        """
         start_time = time.time()
 
         url = self.config.get("url")
@@ -1061,9 +1136,10 @@ class GoogleReviewsScraper:
             # Load seen IDs from file
             seen = self.json_storage.load_seen()
 
-        driver = None
+        own_driver = driver is None
         try:
-            driver = self.setup_driver(headless)
+            if own_driver:
+                driver = self.setup_driver(headless)
             wait = WebDriverWait(driver, 20)  # Reduced from 40 to 20 for faster timeout
 
             driver.get(url)
@@ -1083,14 +1159,34 @@ class GoogleReviewsScraper:
                 log.warning("Could not find reviews pane. Page structure might have changed.")
                 return False
 
-            pbar = tqdm(desc="Scraped", ncols=80, initial=len(seen))
+            pbar = tqdm(desc="Scraped", ncols=80, initial=len(seen), mininterval=0.5)
             idle = 0
             processed_ids = set()  # Track processed IDs in current session
+            seen_bloom = self._build_seen_filter(seen)  # Cheap pre-check before set lookups
+
+            # Stream batches of merged reviews to MongoDB from a background
+            # thread instead of one monolithic save_reviews(docs) at the end.
+            # Overlaps Mongo I/O with the Selenium loop and keeps progress
+            # if the scrape crashes midway.
+            mongo_batch_size = 500
+            pending_ids: List[str] = []
+            mongo_executor = (ThreadPoolExecutor(max_workers=1)
+                              if self.use_mongodb and self.mongodb else None)
+
+            def flush_pending():
+                if not pending_ids:
+                    return
+                batch = {rid: docs[rid].copy() for rid in pending_ids}
+                pending_ids.clear()
+                mongo_executor.submit(self.mongodb.save_reviews, batch)
 
             # Prefetch selector to avoid repeated lookups
             try:
                 driver.execute_script("window.scrollablePane = arguments[0];", pane)
-                scroll_script = "window.scrollablePane.scrollBy(0, window.scrollablePane.scrollHeight);"
+                # Write-only scroll: assigning scrollTop avoids the forced
+                # synchronous layout that reading scrollHeight for scrollBy
+                # would otherwise trigger on every call
+                scroll_script = "window.scrollablePane.scrollTop = window.scrollablePane.scrollHeight;"
             except Exception as e:
                 log.warning(f"Error setting up scroll script: {e}")
                 scroll_script = "window.scrollBy(0, 300);"  # Fallback to simple scrolling
@@ -1112,11 +1208,24 @@ class GoogleReviewsScraper:
                         time.sleep(1)
                         continue
 
+                    # Prefetch: fire the scroll before parsing so the browser
+                    # loads the next batch of reviews while Python is busy
+                    # running from_card/merge_review on this one
+                    try:
+                        driver.execute_script(scroll_script)
+                    except Exception as e:
+                        log.warning(f"Error scrolling: {e}")
+                        # Try a simpler scroll method
+                        driver.execute_script("window.scrollBy(0, 300);")
+
                     for c in cards:
                         try:
                             cid = c.get_attribute("data-review-id")
-                            if not cid or cid in seen or cid in processed_ids:
-                                if stop_on_match and cid and (cid in seen or cid in processed_ids):
+                            # Bloom filter first: a negative means definitely new,
+                            # skipping both set lookups on the common path
+                            if not cid or (cid in seen_bloom and
+                                           (cid in seen or cid in processed_ids)):
+                                if stop_on_match and cid:
                                     idle = 999
                                     break
                                 continue
@@ -1127,10 +1236,12 @@ class GoogleReviewsScraper:
                             log.debug(f"Error getting review ID: {e}")
                             continue
 
+                    new_ids: List[str] = []
+                    # One clock read per scroll batch instead of per review
+                    batch_now = datetime.now(timezone.utc)
                     for card in fresh_cards:
                         try:
-                            raw = RawReview.from_card(card)
-                            processed_ids.add(raw.id)  # Track this ID to avoid re-processing
+                            raw = RawReview.from_card(card, now=batch_now)
                         except StaleElementReferenceException:
                             continue
                         except Exception:
@@ -1139,16 +1250,31 @@ class GoogleReviewsScraper:
                             try:
                                 raw_id = card.get_attribute("data-review-id") or ""
                                 raw = RawReview(id=raw_id, text="", lang="und")
-                                processed_ids.add(raw_id)
                             except StaleElementReferenceException:
                                 continue
 
                         docs[raw.id] = merge_review(docs.get(raw.id), raw)
-                        seen.add(raw.id)
-                        pbar.update(1)
+                        new_ids.append(raw.id)
                         idle = 0
                         attempts = 0  # Reset attempts counter when we successfully process a review
 
+                    # One batched update per scroll iteration instead of
+                    # per-card set.add churn
+                    if new_ids:
+                        pbar.update(len(new_ids))
+                        processed_ids.update(new_ids)
+                        seen.update(new_ids)
+                        for rid in new_ids:
+                            seen_bloom.add(rid)
+                        if mongo_executor:
+                            pending_ids.extend(new_ids)
+                            if len(pending_ids) >= mongo_batch_size:
+                                flush_pending()
+                        # Incrementally persist new IDs so a crash mid-scrape
+                        # doesn't lose which reviews were already collected
+                        if self.backup_to_json and not self.overwrite_existing:
+                            self.json_storage.append_seen(new_ids)
+
                     if idle >= 3:
                         break
 
@@ -1156,14 +1282,6 @@ class GoogleReviewsScraper:
                         idle += 1
                         attempts += 1
 
-                    # Use JavaScript for smoother scrolling
-                    try:
-                        driver.execute_script(scroll_script)
-                    except Exception as e:
-                        log.warning(f"Error scrolling: {e}")
-                        # Try a simpler scroll method
-                        driver.execute_script("window.scrollBy(0, 300);")
-
                     # Dynamic sleep: sleep less when processing many reviews
                     #sleep_time = 0.7 if len(fresh_cards) > 5 else 1.0
                     sleep_time = 0.1 if len(fresh_cards) > 5 else 0.3
@@ -1185,16 +1303,19 @@ class GoogleReviewsScraper:
 
             pbar.close()
 
-            # Save to MongoDB if enabled
-            if self.use_mongodb and self.mongodb:
-                log.info("Saving reviews to MongoDB...")
-                self.mongodb.save_reviews(docs)
+            # Flush any remaining buffered reviews to MongoDB
+            if mongo_executor:
+                log.info("Flushing remaining reviews to MongoDB...")
+                flush_pending()
+                mongo_executor.shutdown(wait=True)
 
             # Backup to JSON if enabled
             if self.backup_to_json:
                 log.info("Backing up to JSON...")
                 self.json_storage.save_json_docs(docs)
-                self.json_storage.save_seen(seen)
+                if self.overwrite_existing:
+                    # Fresh run: nothing was appended, write the set once
+                    self.json_storage.save_seen(seen)
 
             log.info("✅ Finished – total unique reviews: %s", len(docs))
 
@@ -1202,7 +1323,9 @@ class GoogleReviewsScraper:
             elapsed_time = end_time - start_time
             log.info(f"Execution completed in {elapsed_time:.2f} seconds")
 
-            return True
+            return {"review_count": len(docs),
+                    "new_reviews": len(processed_ids),
+                    "elapsed_seconds": elapsed_time}
 
         except Exception as e:
             log.error(f"Error during scraping: {e}")
@@ -1210,7 +1333,7 @@ class GoogleReviewsScraper:
             return False
 
         finally:
-            if driver is not None:
+            if driver is not None and own_driver:
                 try:
                     driver.quit()
                 except Exception:
@@ -5,6 +5,7 @@ import datetime
 import logging
 import re
 import time
+from array import array
 from datetime import timezone
 from functools import lru_cache
 from typing import List
@@ -25,19 +26,93 @@ log = logging.getLogger("scraper")
 HEB_CHARS = re.compile(r"[\u0590-\u05FF]")
 THAI_CHARS = re.compile(r"[\u0E00-\u0E7F]")
 
+# Unicode-block \u2192 language lookup table, indexed by the high byte of a BMP
+# codepoint (codepoint >> 8). Gives an O(1) language guess from the first
+# non-ASCII character instead of running full detection per stub.
+_BLOCK_ISO = ("und", "he", "th", "ar", "ru", "el", "hi", "ja", "ko", "zh")
+_BLOCK_TO_LANG = array('B', bytes(256))
+
+
+def _fill_blocks(lo: int, hi: int, lang_index: int):
+    for block in range(lo >> 8, (hi >> 8) + 1):
+        _BLOCK_TO_LANG[block] = lang_index
+
+
+_fill_blocks(0x0590, 0x05FF, 1)  # Hebrew
+_fill_blocks(0x0E00, 0x0E7F, 2)  # Thai
+_fill_blocks(0x0600, 0x06FF, 3)  # Arabic
+_fill_blocks(0x0400, 0x04FF, 4)  # Cyrillic
+_fill_blocks(0x0370, 0x03FF, 5)  # Greek
+_fill_blocks(0x0900, 0x097F, 6)  # Devanagari
+_fill_blocks(0x3040, 0x30FF, 7)  # Hiragana / Katakana
+_fill_blocks(0xAC00, 0xD7AF, 8)  # Hangul
+_fill_blocks(0x4E00, 0x9FFF, 9)  # CJK ideographs
+
+
+def guess_lang(txt: str) -> str:
+    """Cheap language guess from the first non-ASCII character's Unicode block"""
+    cp = next((ord(c) for c in txt if ord(c) > 127), 0)
+    if not cp or cp > 0xFFFF:
+        return "und"
+    return _BLOCK_ISO[_BLOCK_TO_LANG[cp >> 8]]
+
+
+# Language is evident from a prefix; scanning a whole multi-KB review
+# buys no accuracy, so long inputs are capped at this many chars.
+_DETECT_SCAN_CAP = 256
+
 
 @lru_cache(maxsize=1024)
 def detect_lang(txt: str) -> str:
     """Detect language based on character sets"""
-    if HEB_CHARS.search(txt):  return "he"
-    if THAI_CHARS.search(txt): return "th"
+    # Single pass over the codepoints: cheaper than regex setup for the
+    # short strings this sees, and the first non-ASCII char doubles as the
+    # input for the block-table guess
+    if len(txt) > _DETECT_SCAN_CAP:
+        txt = txt[:_DETECT_SCAN_CAP]
+    first_non_ascii = 0
+    for c in txt:
+        o = ord(c)
+        if 0x0590 <= o <= 0x05FF:
+            return "he"
+        if 0x0E00 <= o <= 0x0E7F:
+            return "th"
+        if o > 127 and not first_non_ascii:
+            first_non_ascii = o
+    if first_non_ascii and first_non_ascii <= 0xFFFF:
+        guessed = _BLOCK_ISO[_BLOCK_TO_LANG[first_non_ascii >> 8]]
+        if guessed != "und":
+            return guessed
     return "en"
 
 
-@lru_cache(maxsize=128)
+def detect_langs_batch(texts) -> List[str]:
+    """
+    Batch counterpart of detect_lang for post-processing collected reviews.
+    Not used by the scrape loop itself (which tags per card in from_card);
+    intended for external pipelines re-tagging an exported reviews.json.
+
+    The function lookup is hoisted and a plain dict keyed on the text
+    replaces lru_cache's locked lookup for intra-batch duplicates
+    (empty texts, copy-pasted reviews).
+    """
+    detect = detect_lang
+    cache: dict = {}
+    out = []
+    for t in texts:
+        t = t or ""
+        lang = cache.get(t)
+        if lang is None:
+            lang = cache[t] = detect(t)
+        out.append(lang)
+    return out
+
+
 def safe_int(s: str | None) -> int:
     """Safely convert string to integer, returning 0 if not possible"""
-    m = re.search(r"\d+", s or "")
+    # No lru_cache here: the lock + hash + dict lookup costs more than the
+    # single compiled-regex search it would save
+    m = _DIGIT_RE.search(s or "")
     return int(m.group()) if m else 0
 
 
@@ -63,54 +138,96 @@ def first_text(el: WebElement, css: str) -> str:
     return ""
 
 
-def parse_date_to_iso(date_str: str) -> str:
+# Relative-date parsing: one compiled pattern plus a unit -> seconds table.
+# All patterns are compiled at module scope so hot callers never touch the
+# re module's internal pattern cache.
+_DIGIT_RE = re.compile(r"\d+")
+_AGO_RE = re.compile(r"(\d+)?\s*(minute|hour|day|week|month|year)", re.IGNORECASE)
+_AGO_UNITS = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,  # approximate, 30 days
+    "year": 31536000,  # approximate, 365 days
+}
+
+
+def parse_date_to_iso(date_str: str, now: "datetime.datetime | None" = None) -> str:
     """
     Parse date strings like "2 weeks ago", "January 2023", etc. into ISO format.
     Returns a best-effort ISO string, or empty string if parsing fails.
+
+    Callers parsing a batch of dates can capture "now" once and pass it in
+    to avoid a clock_gettime syscall per review.
     """
     if not date_str:
         return ""
 
     try:
-        now = datetime.now(timezone.utc)
-
-        # Handle relative dates
-        if "ago" in date_str.lower():
-            # For simplicity, map to approximate dates
-            if "minute" in date_str.lower():
-                minutes = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                dt = now.replace(microsecond=0) - timezone.timedelta(minutes=minutes)
-            elif "hour" in date_str.lower():
-                hours = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                dt = now.replace(microsecond=0) - timezone.timedelta(hours=hours)
-            elif "day" in date_str.lower():
-                days = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                dt = now.replace(microsecond=0) - timezone.timedelta(days=days)
-            elif "week" in date_str.lower():
-                weeks = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                dt = now.replace(microsecond=0) - timezone.timedelta(weeks=weeks)
-            elif "month" in date_str.lower():
-                months = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                # Approximate months as 30 days
-                dt = now.replace(microsecond=0) - timezone.timedelta(days=30 * months)
-            elif "year" in date_str.lower():
-                years = int(re.search(r'\d+', date_str).group()) if re.search(r'\d+', date_str) else 1
-                # Approximate years as 365 days
-                dt = now.replace(microsecond=0) - timezone.timedelta(days=365 * years)
-            else:
-                # Default to current time if can't parse
-                dt = now.replace(microsecond=0)
-        else:
-            # Handle absolute dates (month year format)
-            # This is a simplification - would need more robust parsing for production
-            dt = now.replace(microsecond=0)
-
-        return dt.isoformat()
+        if now is None:
+            now = datetime.datetime.now(timezone.utc)
+        now = now.replace(microsecond=0)
+        lowered = date_str.lower()
+
+        if "ago" in lowered:
+            # Single pass extracts both the number and the unit
+            m = _AGO_RE.search(lowered)
+            if m:
+                num = int(m.group(1)) if m.group(1) else 1
+                dt = now - datetime.timedelta(seconds=num * _AGO_UNITS[m.group(2)])
+                return _format_iso_utc(dt)
+
+        # Absolute dates (month year format) fall back to current time
+        # This is a simplification - would need more robust parsing for production
+        return _format_iso_utc(now)
     except Exception:
         # If parsing fails, return empty string
         return ""
 
 
+def _format_iso_utc(dt: "datetime.datetime") -> str:
+    """
+    Emit YYYY-MM-DDTHH:MM:SS+00:00 via direct integer formatting.
+    The output shape is fixed (UTC, zero microseconds), so this skips
+    isoformat()'s microsecond/tzinfo handling.
+    """
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}+00:00")
+
+
+def parse_dates_to_iso_batch(date_strings) -> "object":
+    """
+    Vectorized counterpart of parse_date_to_iso for a batch of date strings.
+
+    Relative "ago" dates are converted with pd.to_timedelta; absolute dates
+    go through pandas' C-level to_datetime parser. Returns a pandas Series
+    of ISO strings ("" where parsing fails).
+    """
+    import pandas as pd
+
+    s = pd.Series(date_strings, dtype="object").fillna("").astype(str)
+    lowered = s.str.lower()
+    now = pd.Timestamp.now(tz="UTC").replace(microsecond=0, nanosecond=0)
+
+    out = pd.Series("", index=s.index, dtype="object")
+
+    is_ago = lowered.str.contains("ago", regex=False)
+    if is_ago.any():
+        nums = lowered[is_ago].str.extract(r"(\d+)", expand=False).fillna("1").astype("int64")
+        units = lowered[is_ago].str.extract(r"(minute|hour|day|week|month|year)", expand=False)
+        seconds = units.map(_AGO_UNITS).fillna(0).astype("int64") * nums
+        rel = now - pd.to_timedelta(seconds, unit="s")
+        out[is_ago] = rel.dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+    is_abs = ~is_ago & (s != "")
+    if is_abs.any():
+        parsed = pd.to_datetime(s[is_abs], utc=True, format="mixed", errors="coerce")
+        out[is_abs] = parsed.dt.strftime("%Y-%m-%dT%H:%M:%S+00:00").fillna("")
+
+    return out
+
+
 def first_attr(el: WebElement, css: str, attr: str) -> str:
     """Get attribute value from the first matching element that has a non-empty value"""
     for e in try_find(el, css, all=True):
@@ -136,23 +253,33 @@ def click_if(driver: Chrome, css: str, delay: float = .25, timeout: float = 5.0)
         True if element was found and clicked, False otherwise
     """
     try:
-        # First check if elements exist at all
-        elements = driver.find_elements(By.CSS_SELECTOR, css)
-        if not elements:
+        # One JS round-trip returns the first visible+enabled match, instead
+        # of two is_displayed()/is_enabled() wire calls per found element.
+        # "absent" distinguishes zero matches from matches that are not yet
+        # clickable, so probing a missing selector fails fast instead of
+        # blocking for the full WebDriverWait timeout.
+        element = driver.execute_script(
+            """
+            const els = document.querySelectorAll(arguments[0]);
+            if (els.length === 0) return 'absent';
+            for (const e of els) {
+                const r = e.getBoundingClientRect();
+                if (r.width > 0 && r.height > 0 && !e.disabled) return e;
+            }
+            return null;
+            """, css)
+        if element == 'absent':
             return False
-
-        # Try clicking the first visible element
-        for element in elements:
+        if element is not None:
             try:
-                if element.is_displayed() and element.is_enabled():
-                    element.click()
-                    time.sleep(delay)
-                    return True
+                element.click()
+                time.sleep(delay)
+                return True
             except Exception:
-                # Try next element if this one fails
-                continue
+                # Fall through to the wait-based path below
+                pass
 
-        # If we couldn't click any of the direct elements, try with WebDriverWait
+        # Matches exist but none clickable yet: wait for one to become so
         try:
             WebDriverWait(driver, timeout).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, css))
@@ -167,10 +294,17 @@ def click_if(driver: Chrome, css: str, delay: float = .25, timeout: float = 5.0)
         return False
 
 
+# (monotonic tick, iso string) refreshed at 1-second granularity
+_NOW_CACHE = [0.0, ""]
+
+
 def get_current_iso_date() -> str:
-    """Return current UTC time in ISO format."""
-    from datetime import datetime, timezone
-    return datetime.now(timezone.utc).isoformat()
+    """Return current UTC time in ISO format (cached with a 1-second TTL)."""
+    tick = time.monotonic()
+    if tick - _NOW_CACHE[0] >= 1.0 or not _NOW_CACHE[1]:
+        _NOW_CACHE[0] = tick
+        _NOW_CACHE[1] = datetime.datetime.now(timezone.utc).isoformat()
+    return _NOW_CACHE[1]
 
 # """
 # Utility functions for Google Maps Reviews Scraper.
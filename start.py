@@ -21,15 +21,46 @@ python start.py --csv treat/restaurants_001.csv --base-dir treat/restaurants_001
 python start.py --csv treat/restaurants_006.csv --base-dir treat/restaurants_006 --headless --skip-exists
 """
 
+import atexit
+import glob
+import mmap
 import os
 import logging
+import random
+import re
+import sys
 import time
+import traceback
 import argparse
+from functools import lru_cache
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import yaml
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from charset_normalizer import from_bytes as _cn_from_bytes
+except ImportError:
+    _cn_from_bytes = None
+
+try:
+    import pyarrow.csv as pacsv  # 병렬 SIMD CSV 파서
+except ImportError:
+    pacsv = None
+
+try:
+    from yaml import CSafeDumper as ConfigDumper  # libyaml C emitter
+except ImportError:
+    from yaml import SafeDumper as ConfigDumper
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
 from modules.config import load_config
 from modules.scraper import GoogleReviewsScraper
 
@@ -41,9 +72,12 @@ def parse_args():
     """명령줄 인수 파싱"""
     parser = argparse.ArgumentParser(description="CSV 파일에서 레스토랑 정보를 불러와 Google Maps 리뷰 스크랩")
     
-    parser.add_argument("--csv", type=str, required=True,
-                        help="레스토랑 정보가 담긴 CSV 파일 경로 (필수)")
-    
+    parser.add_argument("--csv", type=str, default=None,
+                        help="레스토랑 정보가 담긴 CSV 파일 경로")
+
+    parser.add_argument("--csv-glob", type=str, default=None,
+                        help="여러 CSV를 한 번에 처리할 글롭 패턴 (예: 'treat/restaurants_*.csv')")
+
     parser.add_argument("--base-dir", type=str, default="restaurant_data",
                         help="데이터 저장 기본 디렉토리 (기본값: restaurant_data)")
     
@@ -59,74 +93,265 @@ def parse_args():
     parser.add_argument("--download-images", action="store_true", default=True,
                         help="리뷰 이미지 다운로드 여부 (기본값: True)")
     
-    parser.add_argument("--skip-exists", action="store_true", 
+    parser.add_argument("--skip-exists", action="store_true",
                         help="이미 처리한 레스토랑 건너뛰기 (폴더 존재 + reviews.json 존재 + 내용이 빈 리스트가 아닌 경우)")
-    
-    return parser.parse_args()
 
-def should_skip_restaurant(base_dir):
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="동시에 실행할 워커(브라우저) 수 (기본값: min(4, CPU 수))")
+
+    parser.add_argument("--retry-delay", type=float, default=5.0,
+                        help="재시도 백오프의 기본 대기 시간(초, 기본값: 5.0)")
+
+    parser.add_argument("--rpm", type=float, default=0,
+                        help="분당 최대 레스토랑 처리 수, 전체 워커 합산 (기본값: 0, 제한 없음)")
+
+    parser.add_argument("--dump-config", action="store_true",
+                        help="레스토랑별 config.yaml을 디스크에 기록 (디버깅용, 기본값: False)")
+
+    parser.add_argument("--yes", "-y", action="store_true",
+                        help="실행 전 확인 프롬프트 없이 바로 진행 (CI/cron 등 배치 실행용)")
+
+    args = parser.parse_args()
+    if not args.csv and not args.csv_glob:
+        parser.error("--csv 또는 --csv-glob 중 하나는 필수입니다.")
+    return args
+
+def _expected_reviews(restaurant):
+    """CSV의 userRatingCount를 정수로 (없거나 파싱 불가면 0)"""
+    try:
+        return int(restaurant.get('userRatingCount') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def should_skip_restaurant(base_dir, expected_reviews=0):
     """
     레스토랑을 건너뛸지 판단하는 함수
     조건: 폴더 존재 + reviews.json 존재 + 파일 크기 > 10바이트 + 내용이 빈 리스트가 아님
+    expected_reviews: CSV의 userRatingCount - 있으면 크기 휴리스틱 빠른 경로 사용
     """
     try:
-        # 1. 폴더가 존재하는지 확인
-        if not base_dir.exists():
-            return False, "폴더가 존재하지 않음"
-        
-        # 2. reviews.json 파일이 존재하는지 확인
-        json_path = base_dir / "reviews.json"
-        if not json_path.exists():
+        json_path = os.path.join(base_dir, "reviews.json")
+
+        # 1+2+3. 폴더/파일 존재와 크기를 os.stat 한 번으로 확인
+        # (exists() + exists() + stat() 세 번의 syscall을 한 번으로 줄임)
+        try:
+            st = os.stat(json_path)
+        except FileNotFoundError:
+            # 실패 경로에서만 폴더 존재 여부를 추가 확인 (기존 메시지 유지)
+            if not os.path.isdir(base_dir):
+                return False, "폴더가 존재하지 않음"
             return False, "reviews.json 파일이 존재하지 않음"
-        
-        # 3. 파일 크기 확인 (최소 10바이트 이상)
-        if json_path.stat().st_size <= 10:
-            return False, f"reviews.json 파일이 너무 작음 ({json_path.stat().st_size} 바이트)"
-        
+
+        if st.st_size <= 10:
+            return False, f"reviews.json 파일이 너무 작음 ({st.st_size} 바이트)"
+
+        # 크기 휴리스틱: 기대 리뷰 수가 작고 파일이 리뷰당 최소 바이트 수를
+        # 넘으면 파일을 열지 않고 통과 (indent=2 포맷은 리뷰당 200바이트 이상)
+        if 0 < expected_reviews < 50 and st.st_size > expected_reviews * 200:
+            return True, f"크기 휴리스틱 통과 ({st.st_size} 바이트, 기대 {expected_reviews}개)"
+
         # 4. 파일 내용 확인 (빈 리스트가 아닌지)
+        # 사전 검사와 스크랩 후 검증이 같은 파일을 두 번 읽지 않도록
+        # (경로, mtime, 크기) 키로 캐시 - 스크랩으로 파일이 바뀌면 키도 바뀐다
+        return _check_review_quality_cached(json_path, st.st_mtime_ns, st.st_size)
+
+    except Exception as e:
+        return False, f"검사 중 오류: {e}"
+
+
+@lru_cache(maxsize=None)
+def _check_review_quality_cached(json_path, mtime_ns, size):
+    """check_review_quality의 메모이즈 래퍼 (파일이 변하면 키가 달라져 재검사)"""
+    return check_review_quality(json_path)
+
+
+def _is_empty_json_array(path):
+    """
+    파일이 빈 JSON 배열('[]')인지 앞 64바이트만 보고 판단
+    반환값: True(빈 배열) / False(내용 있는 배열) / None(판단 불가)
+    이 크기의 peek에는 mmap보다 단일 read가 더 싸다 (mmap 설정 + 페이지 폴트 비용)
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(64)
+    except OSError:
+        return None
+
+    stripped = head.lstrip(b'\xef\xbb\xbf \t\r\n')
+    if stripped.startswith(b'['):
+        rest = stripped[1:].lstrip(b' \t\r\n')
+        if rest.startswith(b']'):
+            return True
+        if rest:
+            return False
+    return None
+
+
+def check_review_quality(json_path):
+    """
+    reviews.json 내용 검사 - 유효한 리뷰 데이터가 있는지 판단
+    반환값: (ok, 사유)
+    """
+    # 앞부분 몇 바이트만 읽어 빈 리스트 여부를 판단 (전체 파싱 회피)
+    try:
+        empty = _is_empty_json_array(json_path)
+        if empty is True:
+            return False, "reviews.json이 빈 리스트임"
+        if empty is False:
+            return True, "유효한 리뷰 데이터 존재"
+
+        # 리뷰 수가 필요할 뿐이라면 객체 트리를 만들지 않고 mmap 바이트 스캔으로 센다.
+        # save_json_docs가 쓰는 포맷에서 "review_id" 키는 리뷰당 정확히 한 번 등장하고,
+        # 리뷰 본문에 같은 문자열이 있어도 JSON 이스케이프(\\") 때문에 바이트 패턴이 다르다.
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                
-            # JSON 파싱 시도
-            try:
-                data = json.loads(content)
-                if isinstance(data, list):
-                    if len(data) == 0:
-                        return False, "reviews.json이 빈 리스트임"
-                    else:
-                        return True, f"유효한 리뷰 데이터 {len(data)}개 존재"
+            with open(json_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # mmap에는 count()가 없으므로 find()로 순회
+                    count = 0
+                    pos = mm.find(b'"review_id"')
+                    while pos != -1:
+                        count += 1
+                        pos = mm.find(b'"review_id"', pos + 11)
+            if count:
+                return True, f"유효한 리뷰 데이터 {count}개 존재"
+        except (OSError, ValueError):
+            pass
+
+        # 리뷰 키가 하나도 없으면 전체 파싱으로 폴백
+        # (orjson이 있으면 C 파서로 디코딩, 바이트를 그대로 넘겨 .strip() 생략)
+        with open(json_path, 'rb') as f:
+            content = f.read()
+
+        # JSON 파싱 시도
+        try:
+            data = orjson.loads(content) if orjson else json.loads(content)
+            if isinstance(data, list):
+                if len(data) == 0:
+                    return False, "reviews.json이 빈 리스트임"
                 else:
-                    # 리스트가 아닌 경우도 데이터가 있다고 판단
-                    return True, "유효한 데이터 존재 (리스트 형태 아님)"
-            except json.JSONDecodeError as e:
-                return False, f"JSON 파싱 오류: {e}"
-                
-        except Exception as e:
-            return False, f"파일 읽기 오류: {e}"
-            
+                    return True, f"유효한 리뷰 데이터 {len(data)}개 존재"
+            else:
+                # 리스트가 아닌 경우도 데이터가 있다고 판단
+                return True, "유효한 데이터 존재 (리스트 형태 아님)"
+        except json.JSONDecodeError as e:
+            return False, f"JSON 파싱 오류: {e}"
+
     except Exception as e:
-        return False, f"검사 중 오류: {e}"
+        return False, f"파일 읽기 오류: {e}"
+
+def analyze_existing_data(base_dir_path):
+    """
+    기존 수집 데이터 현황 분석
+    os.scandir 한 번으로 폴더 목록과 타입을 얻는다 (listdir + is_dir N번 대신
+    DirEntry의 캐시된 d_type 사용 - 폴더당 syscall 수를 1회 수준으로 줄임)
+    반환값: {'folders': n, 'with_reviews': n, 'empty': n}
+    """
+    try:
+        with os.scandir(base_dir_path) as it:
+            dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return {'folders': 0, 'with_reviews': 0, 'empty': 0}
+
+    # 폴더별 검사는 stat/read 위주의 I/O 바운드 작업이라 스레드로 병렬화
+    # (네트워크 스토리지에서 순차 검사 대비 수 배 빠름)
+    if len(dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(dirs))) as ex:
+            verdicts = list(ex.map(should_skip_restaurant, dirs))
+    else:
+        verdicts = [should_skip_restaurant(p) for p in dirs]
+    with_reviews = sum(1 for ok, _ in verdicts if ok)
+
+    return {'folders': len(dirs),
+            'with_reviews': with_reviews,
+            'empty': len(dirs) - with_reviews}
+
+
+# 폴더명에서 허용하지 않는 문자 (유니코드 단어 문자, 공백, '-' 외 전부)
+# 행 단위 폴백과 load_restaurants_from_csv의 벡터 경로가 같은 패턴을 공유한다.
+# str.translate 테이블도 고려했으나 BMP 밖 문자까지 다루려면 정규식이 적합.
+_SANITIZE_RE = re.compile(r'[^\w \-]')
+
+# URL에 리뷰 파라미터가 이미 있는지 - 두 부분 문자열 검색을 한 번의 스캔으로
+_HAS_REVIEW_DATA = re.compile(r'data=|!9m1!1b1').search
+
+# 설정 생성에 실제로 사용하는 컬럼만 읽는다
+CSV_COLUMNS = ('displayName', 'googleMapsUri', 'placeUri', 'id', 'name',
+               'formattedAddress', 'shortFormattedAddress', 'rating', 'userRatingCount')
+
+
+@lru_cache(maxsize=32)
+def _detect_csv_encoding(csv_path, mtime):
+    """
+    파일 앞 64KB 샘플로 인코딩 감지 (mtime 키로 캐시되어 재시도 시 생략)
+    charset_normalizer가 없거나 감지 실패 시 None
+    """
+    if _cn_from_bytes is None:
+        return None
+    try:
+        with open(csv_path, 'rb') as f:
+            sample = f.read(65536)
+        best = _cn_from_bytes(sample).best()
+        return best.encoding if best else None
+    except Exception:
+        return None
+
 
 def load_restaurants_from_csv(csv_path):
     """CSV 파일에서 레스토랑 정보 불러오기"""
     try:
-        # 다양한 인코딩 시도
+        # 인코딩 감지: 64KB 샘플로 한 번 판별하고, 실패 시에만 목록을 순회
+        # (비 UTF-8 CSV에서 전체 파일을 여러 번 디코딩하는 시도를 제거)
         encodings = ['utf-8', 'cp949', 'euc-kr', 'latin1']
+        try:
+            detected = _detect_csv_encoding(csv_path, os.stat(csv_path).st_mtime)
+        except OSError:
+            detected = None
+        if detected:
+            encodings = [detected] + [e for e in encodings if e != detected]
         df = None
-        
-        for encoding in encodings:
+
+        # pyarrow가 있으면 병렬 파서로 먼저 시도 (대용량 CSV에서 수 배 빠름)
+        if pacsv is not None:
             try:
-                df = pd.read_csv(csv_path, encoding=encoding)
-                log.info(f"CSV 파일 로드 성공 (인코딩: {encoding})")
-                break
-            except UnicodeDecodeError:
-                continue
+                table = pacsv.read_csv(
+                    csv_path,
+                    read_options=pacsv.ReadOptions(encoding=encodings[0]))
+                df = table.to_pandas()
+                df = df[[c for c in df.columns if c in CSV_COLUMNS]]
+                for col in df.columns:
+                    if col not in ('rating', 'userRatingCount'):
+                        df[col] = df[col].fillna('').astype(str)
+                log.info("CSV 파일 로드 성공 (pyarrow, 인코딩: %s)", encodings[0])
+            except Exception as e:
+                log.debug("pyarrow CSV 로드 실패, pandas로 폴백: %s", e)
+                df = None
+
+        if df is None:
+            for encoding in encodings:
+                try:
+                    # 필요한 컬럼만 문자열로 읽어 dtype 추론과 NaN 스캔을 생략
+                    df = pd.read_csv(csv_path, encoding=encoding,
+                                     usecols=lambda c: c in CSV_COLUMNS,
+                                     dtype=str, na_filter=False, engine='c')
+                    log.info(f"CSV 파일 로드 성공 (인코딩: {encoding})")
+                    break
+                except UnicodeDecodeError:
+                    continue
         
         if df is None:
             log.error("CSV 파일을 로드할 수 없습니다. 지원되지 않는 인코딩입니다.")
             return []
-        
+
+        return _finalize_restaurants_df(df)
+    except Exception as e:
+        log.error(f"CSV 파일 로드 중 오류 발생: {e}")
+        return []
+
+
+def _finalize_restaurants_df(df):
+    """로드된 DataFrame 검증/정리 후 레스토랑 딕셔너리 리스트로 변환"""
+    try:
         # 필요한 컬럼이 있는지 확인
         required_columns = ['displayName']
         recommended_columns = ['googleMapsUri', 'placeUri', 'id']
@@ -139,9 +364,42 @@ def load_restaurants_from_csv(csv_path):
         missing_recommended = [col for col in recommended_columns if col not in df.columns]
         if missing_recommended:
             log.warning(f"CSV 파일에 권장 컬럼이 없습니다: {missing_recommended}")
-        
+
+        # 중복 행 제거 - 같은 레스토랑을 두 번 스크랩하지 않도록
+        # (재실행/CSV 병합 시 흔함, 브라우저 기동 횟수를 그만큼 줄인다)
+        dedupe_cols = [c for c in ('id', 'displayName', 'googleMapsUri') if c in df.columns]
+        if dedupe_cols:
+            before = len(df)
+            df = df.drop_duplicates(subset=dedupe_cols, keep='first')
+            if len(df) < before:
+                log.info("중복 레스토랑 %d개 제거 (%d → %d)", before - len(df), before, len(df))
+
+        # 숫자 컬럼은 기존과 동일하게 숫자 타입으로 복원 (빈 값은 '')
+        for col in ('rating', 'userRatingCount'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        df = df.fillna('')
+
+        # folder_name/url을 행 단위 파이썬 루프 대신 C 레벨 벡터 연산으로 일괄 생성
+        # (create_config_for_restaurant는 이 값이 있으면 그대로 사용)
+        df['folder_name'] = df['displayName'].str.replace(_SANITIZE_RE, '_', regex=True)
+
+        gm = df['googleMapsUri'] if 'googleMapsUri' in df.columns else pd.Series('', index=df.index)
+        pu = df['placeUri'] if 'placeUri' in df.columns else pd.Series('', index=df.index)
+        url = gm.where(gm != '', pu)
+
+        if 'id' in df.columns:
+            ids = df['id'].str.strip()
+            needs_review_url = (url.str.contains('place', regex=False)
+                                & ~url.str.contains('data=', regex=False)
+                                & ~url.str.contains('!9m1!1b1', regex=False)
+                                & (ids != ''))
+            url = url.where(~needs_review_url,
+                            url.str.rstrip('/') + '/data=!4m4!3m3!1s' + ids + '!9m1!1b1')
+        df['url'] = url
+
         # 데이터프레임을 딕셔너리 리스트로 변환
-        restaurants = df.fillna('').to_dict('records')
+        restaurants = df.to_dict('records')
         
         log.info(f"CSV 파일에서 {len(restaurants)}개의 레스토랑 정보를 불러왔습니다.")
         return restaurants
@@ -149,6 +407,38 @@ def load_restaurants_from_csv(csv_path):
         log.error(f"CSV 파일 로드 중 오류 발생: {e}")
         return []
 
+
+def load_restaurants_from_glob(pattern):
+    """
+    글롭 패턴에 맞는 모든 CSV를 한 번에 로드
+    pyarrow dataset이 있으면 파일들을 병렬로 스캔해 하나의 테이블로 합친다
+    (파일 수가 아니라 전체 바이트 수에 비례하는 스캔 시간)
+    """
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        log.error(f"글롭 패턴에 맞는 CSV 파일이 없습니다: {pattern}")
+        return []
+
+    if pacsv is not None:
+        try:
+            import pyarrow.dataset as pads
+            df = pads.dataset(paths, format='csv').to_table().to_pandas()
+            df = df[[c for c in df.columns if c in CSV_COLUMNS]]
+            for col in df.columns:
+                if col not in ('rating', 'userRatingCount'):
+                    df[col] = df[col].fillna('').astype(str)
+            log.info("CSV %d개 파일 로드 성공 (pyarrow dataset)", len(paths))
+            return _finalize_restaurants_df(df)
+        except Exception as e:
+            log.debug("pyarrow dataset 로드 실패, 파일별 로드로 폴백: %s", e)
+
+    # 폴백: 파일별로 로드해 이어붙임
+    restaurants = []
+    for p in paths:
+        restaurants.extend(load_restaurants_from_csv(p))
+    return restaurants
+
+
 def create_config_for_restaurant(restaurant, args):
     """각 레스토랑에 대한 설정 생성"""
     # 기본 설정
@@ -167,17 +457,19 @@ def create_config_for_restaurant(restaurant, args):
         "preserve_original_urls": True,
     }
     
-    # 폴더명으로 사용할 displayName 가져오기
-    folder_name = restaurant.get('displayName', '')
+    # 폴더명: CSV 로드 단계에서 벡터 연산으로 미리 정리된 값을 우선 사용
+    folder_name = restaurant.get('folder_name', '')
     if not folder_name:
-        log.warning(f"displayName이 없습니다. 레스토랑 정보: {restaurant}")
-        folder_name = f"restaurant_{restaurant.get('id', 'unknown')}"
-    
-    # 특수문자 제거 및 폴더명 정리
-    folder_name = "".join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in folder_name)
-    
-    # 구글맵스 URL 가져오기 (googleMapsUri 또는 placeUri)
-    url = restaurant.get('googleMapsUri') or restaurant.get('placeUri')
+        folder_name = restaurant.get('displayName', '')
+        if not folder_name:
+            log.warning(f"displayName이 없습니다. 레스토랑 정보: {restaurant}")
+            folder_name = f"restaurant_{restaurant.get('id', 'unknown')}"
+        # 특수문자 제거 및 폴더명 정리 (문자 단위 파이썬 루프 대신 C 레벨 정규식 치환)
+        folder_name = _SANITIZE_RE.sub('_', folder_name)
+
+    # 구글맵스 URL 가져오기 (미리 계산된 url → googleMapsUri → placeUri 순)
+    url = (restaurant.get('url') or restaurant.get('googleMapsUri')
+           or restaurant.get('placeUri'))
     
     # URL이 없는 경우 검색 URL 생성 시도
     if not url:
@@ -192,7 +484,7 @@ def create_config_for_restaurant(restaurant, args):
             return None, None, None
     
     # /data=!4m4!3m3!1s0... 부분 추가 (리뷰 페이지로 이동)
-    if "data=" not in url and "!9m1!1b1" not in url and "place" in url:
+    if not _HAS_REVIEW_DATA(url) and "place" in url:
         place_id = restaurant.get('id', '')
         if place_id and place_id.strip() != "":
             # URL에 리뷰 파라미터 추가
@@ -228,19 +520,198 @@ def save_config(config, config_path):
     """설정 파일 저장"""
     try:
         with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=ConfigDumper, default_flow_style=False)
         return True
     except Exception as e:
         log.error(f"설정 파일 저장 중 오류: {e}")
         return False
 
+class _TokenBucket:
+    """
+    토큰 버킷 레이트 리미터 - 평균 분당 rate_per_min 호출, capacity만큼 버스트 허용
+    고정 슬립과 달리 한도에 실제로 도달했을 때만 대기한다
+    """
+
+    def __init__(self, rate_per_min, capacity=None):
+        self.rate = rate_per_min / 60.0  # 초당 토큰 충전 속도
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_min / 6.0)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
+    def acquire(self):
+        """토큰 1개를 소비, 부족하면 충전될 때까지 대기"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            time.sleep((1.0 - self.tokens) / self.rate)
+
+
+# 워커(프로세스)당 리미터 - 전체 rpm 예산을 워커 수로 나눠 가진다
+_worker_limiter = None
+
+
+def _get_worker_limiter(args):
+    """현재 워커의 레이트 리미터 반환 (--rpm 미지정 시 None)"""
+    global _worker_limiter
+    if _worker_limiter is None and args.rpm > 0:
+        _worker_limiter = _TokenBucket(args.rpm / max(args.workers, 1))
+    return _worker_limiter
+
+
+# 워커(프로세스)당 하나의 Chrome 인스턴스를 재사용해 레스토랑마다
+# 브라우저를 새로 띄우는 수 초의 기동 비용을 없앤다
+_worker_driver = None
+
+
+def _get_worker_driver(scraper, headless):
+    """현재 워커의 공유 드라이버 반환 (죽었거나 없으면 새로 생성)"""
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            # 이전 레스토랑 처리 중 세션이 죽었으면 조용히 교체
+            _worker_driver.execute_script("return 1")
+        except Exception:
+            _close_worker_driver()
+    if _worker_driver is None:
+        _worker_driver = scraper.setup_driver(headless)
+        atexit.register(_close_worker_driver)
+    return _worker_driver
+
+
+def _close_worker_driver():
+    """공유 드라이버 종료 (오류 발생 시 다음 시도에서 새로 생성)"""
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except Exception:
+            pass
+        _worker_driver = None
+
+
+def _retry_delay(attempt, base=5.0):
+    """지수 백오프 + 지터 (최대 30초). 고정 대기보다 일시 오류에서 빠르게 복구"""
+    return min(base * (2 ** (attempt - 1)) * (1 + random.random() * 0.5), 30)
+
+
+def process_restaurant(restaurant, index, total, args, bundle=None):
+    """
+    단일 레스토랑 처리 (병렬 워커에서도 호출됨)
+    bundle: 사전 검사에서 이미 만든 (config, base_dir, folder_name) - 재계산 방지
+    반환값: 'success' | 'transient_fail' | 'permanent_fail' | 'skipped'
+    """
+    restaurant_name = restaurant.get('displayName') or restaurant.get('name', 'Unknown')
+    # %s 지연 포맷: 핸들러가 필터링되면 문자열 조립 자체가 생략된다
+    log.info("[%d/%d] 레스토랑 처리 중: %s", index, total, restaurant_name)
+
+    # 레스토랑 설정: 사전 계산된 번들이 있으면 그대로 사용
+    result = bundle if bundle is not None else create_config_for_restaurant(restaurant, args)
+    if result is None or result[0] is None:
+        log.warning("[%d/%d] %s: 설정 생성 실패, 건너뜁니다.", index, total, restaurant_name)
+        return 'skipped'
+
+    config, base_dir, folder_name = result
+
+    # 디렉토리 생성
+    os.makedirs(base_dir, exist_ok=True)
+    os.makedirs(Path(config["image_dir"]), exist_ok=True)
+
+    # 건너뛰기 판단은 사전 검사에서 이미 끝났으므로 여기서 반복하지 않는다
+    # (디렉토리 스캔/파일 읽기를 레스토랑당 한 번으로 줄임)
+
+    # 설정 파일은 사후 디버깅용일 뿐이므로 (스크래퍼는 메모리의 dict를 직접 받음)
+    # --dump-config 지정 시에만 기록 - 레스토랑당 파일 쓰기 + yaml 직렬화 한 번 절약
+    if args.dump_config:
+        config_path = base_dir / "config.yaml"
+        if not save_config(config, config_path):
+            log.warning("[%d/%d] %s: 설정 파일 저장 실패 (스크랩은 계속 진행)",
+                        index, total, restaurant_name)
+
+    # 스크래퍼 실행 (재시도 로직 포함)
+    max_retries = 3
+    for attempt in range(1, max_retries + 1):
+        if attempt > 1:
+            log.info("[%d/%d] %s: %d번째 재시도 중...", index, total, restaurant_name, attempt)
+        else:
+            log.info("[%d/%d] %s: 스크래퍼 실행 시작", index, total, restaurant_name)
+
+        try:
+            # 레이트 리밋: 한도에 도달한 경우에만 대기
+            limiter = _get_worker_limiter(args)
+            if limiter is not None:
+                limiter.acquire()
+
+            # 스크래퍼 초기화 및 실행 (워커의 공유 브라우저 재사용)
+            scraper = GoogleReviewsScraper(config)
+            stats = scraper.scrape(driver=_get_worker_driver(scraper, args.headless))
+
+            # 스크래퍼가 돌려준 통계가 있으면 방금 쓴 파일을 다시 읽지 않고 검증
+            if isinstance(stats, dict) and stats.get('review_count', 0) > 0:
+                log.info("[%d/%d] %s: 스크래핑 완료 - 리뷰 %d개 (신규 %d개, 시도 %d/%d)",
+                         index, total, restaurant_name, stats['review_count'],
+                         stats.get('new_reviews', 0), attempt, max_retries)
+                return 'success'
+
+            # 통계가 없거나 0개면 기존 파일 기반 검증으로 폴백
+            should_skip, reason = should_skip_restaurant(base_dir, _expected_reviews(restaurant))
+
+            if should_skip:  # 성공적으로 데이터가 있다면
+                log.info("[%d/%d] %s: 스크래핑 완료 및 검증 성공 - %s (시도 %d/%d)",
+                         index, total, restaurant_name, reason, attempt, max_retries)
+                return 'success'
+            elif attempt < max_retries:
+                log.warning("[%d/%d] %s: 스크래핑 검증 실패 - %s, 재시도 예정 (%d/%d)",
+                            index, total, restaurant_name, reason, attempt, max_retries)
+                # scrape()가 내부에서 예외를 삼켰을 수 있으므로 새 브라우저로 재시도
+                _close_worker_driver()
+                time.sleep(_retry_delay(attempt, args.retry_delay))
+            else:
+                log.error("[%d/%d] %s: 최대 재시도 횟수 초과, 스크래핑 실패 - %s",
+                          index, total, restaurant_name, reason)
+                return 'transient_fail'
+        except (TimeoutException, WebDriverException) as e:
+            # 일시적 오류 (타임아웃, 브라우저/네트워크) → 백오프 후 재시도
+            log.error("[%d/%d] %s: 스크래핑 중 일시적 오류: %s", index, total, restaurant_name, e)
+            # format_exc()는 스택 전체를 걷는 비용이 있으므로 레벨이 켜진 경우에만
+            if log.isEnabledFor(logging.ERROR):
+                log.error(traceback.format_exc())
+
+            # 브라우저가 깨졌을 수 있으므로 재시도 시 새로 띄운다
+            _close_worker_driver()
+
+            if attempt < max_retries:
+                log.warning("[%d/%d] %s: 오류 발생, 재시도 예정 (%d/%d)",
+                            index, total, restaurant_name, attempt, max_retries)
+                time.sleep(_retry_delay(attempt, args.retry_delay))
+            else:
+                log.error("[%d/%d] %s: 최대 재시도 횟수 초과, 스크래핑 실패",
+                          index, total, restaurant_name)
+                return 'transient_fail'
+        except Exception as e:
+            # 영구적 오류 (설정/셀렉터 등) → 재시도해도 같은 결과이므로 즉시 중단
+            log.error("[%d/%d] %s: 복구 불가 오류, 재시도 생략: %s", index, total, restaurant_name, e)
+            if log.isEnabledFor(logging.ERROR):
+                log.error(traceback.format_exc())
+            _close_worker_driver()
+            return 'permanent_fail'
+
+    return 'transient_fail'
+
+
 def main():
     """메인 함수"""
     # 명령줄 인수 파싱
     args = parse_args()
     
-    # CSV 파일에서 레스토랑 정보 로드
-    restaurants = load_restaurants_from_csv(args.csv)
+    # CSV 파일에서 레스토랑 정보 로드 (글롭 패턴이면 여러 파일을 한 번에)
+    if args.csv_glob:
+        restaurants = load_restaurants_from_glob(args.csv_glob)
+    else:
+        restaurants = load_restaurants_from_csv(args.csv)
     
     if not restaurants:
         log.error("레스토랑 정보를 불러오지 못했습니다.")
@@ -254,135 +725,88 @@ def main():
     # skip-exists 옵션이 활성화된 경우 사전 검사
     if args.skip_exists:
         log.info("--skip-exists 옵션이 활성화되어 있습니다. 사전 검사를 진행합니다...")
+        stats = analyze_existing_data(args.base_dir)
+        log.info("기존 데이터 현황: 폴더 %d개, 리뷰 보유 %d개, 비어 있음 %d개",
+                 stats['folders'], stats['with_reviews'], stats['empty'])
         to_process = []
+        bundles = []  # 사전 검사에서 만든 설정을 워커로 전달 (중복 생성 제거)
         skip_count = 0
-        
+
         for restaurant in restaurants:
             restaurant_name = restaurant.get('displayName') or restaurant.get('name', 'Unknown')
-            
+
             # 레스토랑 설정 생성 (폴더 경로 확인용)
             result = create_config_for_restaurant(restaurant, args)
-            if result is None:
+            if result is None or result[0] is None:
                 continue
-            
+
             config, base_dir, folder_name = result
-            
+
             # 건너뛸지 판단
-            should_skip, reason = should_skip_restaurant(base_dir)
-            
+            should_skip, reason = should_skip_restaurant(base_dir, _expected_reviews(restaurant))
+
             if should_skip:
-                log.info(f"건너뜀: {restaurant_name} - {reason}")
+                log.info("건너뜀: %s - %s", restaurant_name, reason)
                 skip_count += 1
             else:
-                log.info(f"처리 예정: {restaurant_name} - {reason}")
+                log.info("처리 예정: %s - %s", restaurant_name, reason)
                 to_process.append(restaurant)
-        
+                bundles.append(result)
+
         log.info(f"사전 검사 완료 - 건너뜀: {skip_count}개, 처리 예정: {len(to_process)}개")
         restaurants = to_process
+    else:
+        bundles = None
     
     if not restaurants:
         log.info("처리할 레스토랑이 없습니다.")
         return
     
-    # 스크랩 실행 여부 확인
-    proceed = input(f"{len(restaurants)}개의 레스토랑을 스크랩할 준비가 되었습니다. 진행하시겠습니까? (y/n): ").strip().lower()
-    if proceed != 'y':
-        log.info("스크랩 작업을 취소합니다.")
-        return
+    # 스크랩 실행 여부 확인 (--yes 또는 비대화형 실행이면 input()으로 블로킹하지 않음)
+    if args.yes:
+        log.info(f"{len(restaurants)}개의 레스토랑을 확인 없이 진행합니다 (--yes).")
+    elif not sys.stdin.isatty():
+        log.warning("표준 입력이 터미널이 아니므로 확인 프롬프트를 생략하고 진행합니다.")
+    else:
+        proceed = input(f"{len(restaurants)}개의 레스토랑을 스크랩할 준비가 되었습니다. 진행하시겠습니까? (y/n): ").strip().lower()
+        if proceed != 'y':
+            log.info("스크랩 작업을 취소합니다.")
+            return
     
     # 기본 디렉토리 생성
     os.makedirs(args.base_dir, exist_ok=True)
-    
-    # 처리 결과 요약
-    success = 0
-    failed = 0
-    skipped = 0
-    
-    # 최대 재시도 횟수 설정
-    max_retries = 3
-    
-    # 각 레스토랑 처리
-    for i, restaurant in enumerate(restaurants):
-        restaurant_name = restaurant.get('displayName') or restaurant.get('name', 'Unknown')
-        log.info(f"[{i+1}/{len(restaurants)}] 레스토랑 처리 중: {restaurant_name}")
-        
-        # 레스토랑 설정 생성
-        result = create_config_for_restaurant(restaurant, args)
-        if result is None:
-            log.warning(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 설정 생성 실패, 건너뜁니다.")
-            skipped += 1
-            continue
-        
-        config, base_dir, folder_name = result
-        
-        # 디렉토리 생성
-        os.makedirs(base_dir, exist_ok=True)
-        os.makedirs(Path(config["image_dir"]), exist_ok=True)
-        
-        # 개선된 건너뛰기 로직 (사전 검사에서 걸러지지 않았다면 다시 한 번 확인)
-        if args.skip_exists:
-            should_skip, reason = should_skip_restaurant(base_dir)
-            if should_skip:
-                log.info(f"[{i+1}/{len(restaurants)}] {restaurant_name}: {reason}, 건너뜁니다.")
-                skipped += 1
-                continue
-        
-        # 설정 파일 저장
-        config_path = base_dir / "config.yaml"
-        if not save_config(config, config_path):
-            log.error(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 설정 파일 저장 실패, 건너뜁니다.")
-            failed += 1
-            continue
-        
-        # 스크래퍼 실행 (재시도 로직 추가)
-        for attempt in range(1, max_retries + 1):
-            if attempt > 1:
-                log.info(f"[{i+1}/{len(restaurants)}] {restaurant_name}: {attempt}번째 재시도 중...")
-            else:
-                log.info(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 스크래퍼 실행 시작")
-            
-            try:
-                # 스크래퍼 초기화 및 실행
-                scraper = GoogleReviewsScraper(config)
-                success_scrape = scraper.scrape()
-                
-                # 스크래핑 성공 여부 검증 (개선된 로직 사용)
-                json_path = base_dir / "reviews.json"
-                should_skip, reason = should_skip_restaurant(base_dir)
-                
-                if should_skip:  # 성공적으로 데이터가 있다면
-                    log.info(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 스크래핑 완료 및 검증 성공 - {reason} (시도 {attempt}/{max_retries})")
-                    success += 1
-                    break
-                elif attempt < max_retries:
-                    log.warning(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 스크래핑 검증 실패 - {reason}, 재시도 예정 ({attempt}/{max_retries})")
-                    time.sleep(5)  # 재시도 전 대기
-                else:
-                    log.error(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 최대 재시도 횟수 초과, 스크래핑 실패 - {reason}")
-                    failed += 1
-            except Exception as e:
-                log.error(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 스크래핑 중 오류: {e}")
-                import traceback
-                log.error(traceback.format_exc())
-                
-                if attempt < max_retries:
-                    log.warning(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 오류 발생, 재시도 예정 ({attempt}/{max_retries})")
-                    time.sleep(5)  # 재시도 전 대기
-                else:
-                    log.error(f"[{i+1}/{len(restaurants)}] {restaurant_name}: 최대 재시도 횟수 초과, 스크래핑 실패")
-                    failed += 1
-                    break
-        
-        # 레스토랑 사이에 약간의 딜레이 추가
-        if i < len(restaurants) - 1:
-            log.info("다음 레스토랑으로 넘어가기 전 5초 대기...")
-            time.sleep(5)
-    
+
+    # 각 레스토랑 처리 (workers > 1 이면 프로세스 풀로 병렬 처리)
+    total = len(restaurants)
+    if args.workers > 1 and total > 1:
+        log.info(f"{args.workers}개 워커로 병렬 처리를 시작합니다.")
+        # submit + as_completed: 느린 레스토랑이 결과 수집을 막지 않고,
+        # 완료되는 즉시 진행 상황을 집계/출력할 수 있다
+        results = []
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(process_restaurant, restaurant, i, total, args,
+                                       bundles[i - 1] if bundles else None)
+                       for i, restaurant in enumerate(restaurants, start=1)]
+            for done, future in enumerate(as_completed(futures), start=1):
+                results.append(future.result())
+                log.info("진행: %d/%d 완료", done, total)
+    else:
+        results = [process_restaurant(restaurant, i, total, args,
+                                      bundles[i - 1] if bundles else None)
+                   for i, restaurant in enumerate(restaurants, start=1)]
+
+    # 처리 결과 집계
+    success = results.count('success')
+    transient_fail = results.count('transient_fail')
+    permanent_fail = results.count('permanent_fail')
+    skipped = results.count('skipped')
+
     # 결과 요약 출력
     log.info("\n=== 처리 결과 요약 ===")
     log.info(f"총 레스토랑 수: {len(restaurants)}")
     log.info(f"스크래핑 성공: {success}")
-    log.info(f"스크래핑 실패: {failed}")
+    log.info(f"스크래핑 실패 (일시적): {transient_fail}")
+    log.info(f"스크래핑 실패 (영구적): {permanent_fail}")
     log.info(f"처리 건너뜀: {skipped}")
     
     log.info("\n모든 레스토랑 처리 완료!")